@@ -1,14 +1,24 @@
 import math
+from functools import partial
+import numpy as np
 import pygame
-from time import time
-from enum import Enum
-from typing import Tuple, Literal, List
+from enum import Enum, IntEnum
+from typing import Tuple, List, Union
 
 # TODO: Implement the gravity jump
 # TODO: Implement the projectile launch
 
 
+# Indexes of the entries in PygameApp.text_entries
+TEXT_COORDS, TEXT_VELOCITY, TEXT_AY, TEXT_AX = 0, 1, 2, 3
+
+
 class PyGameText:
+    FONT_SIZE = 24
+
+    # Fonts are shared by every text instance, keyed by (font_style, size)
+    _font_cache = {}
+
     def __init__(
         self,
         text: str,
@@ -22,18 +32,57 @@ class PyGameText:
         self.background_color = background_color
         self.font_style = font_style if font_style else ""
         self.coords = coords
+        self._surface = None
+        self._last_text = None
+        # Region covered by the last render
+        self.rect = None
+
+    def get_font(self):
+        key = (self.font_style, self.FONT_SIZE)
+        font = self._font_cache.get(key)
+
+        if font is None:
+            font = pygame.font.Font(None, self.FONT_SIZE)
+            self._font_cache[key] = font
+
+        return font
+
+    def is_changed(self):
+        return self._surface is None or self.text != self._last_text
 
     def render(self, screen: pygame.surface.Surface):
-        font = pygame.font.Font(None, 24)
-        text = font.render(self.text, True, self.color, self.background_color)
-        screen.blit(text, self.coords)
+        # Only rasterize the text again when it has changed since the last render
+        if self.is_changed():
+            self._surface = self.get_font().render(
+                self.text, True, self.color, self.background_color
+            )
+            self._last_text = self.text
+
+        self.rect = screen.blit(self._surface, self.coords)
+        return self.rect
 
 
 class PyGameFileLogger:
-    def log(self, data: List[Tuple[float, float]], file_name: str):
+    # The logger is mixed into slotted classes, so it has no instance layout of its
+    # own. The host class owns the _stream slot, as PyGameObjecMotion does
+    __slots__ = ()
+
+    STREAM_BUFFER_SIZE = 1 << 16
+
+    def log(self, data: Union[np.ndarray, List[Tuple[float, float]]], file_name: str):
+        # Format every row in a single vectorized pass, appending to the file
         with open(file_name, "a") as f:
-            for data_value in data:
-                f.write(f"{data_value.__str__().replace('(', '').replace(')', '')}\n")
+            np.savetxt(f, np.asarray(data), fmt="%.6g", delimiter=",")
+
+    def open_stream(self, file_name: str):
+        # File where the positions are written as soon as they are recorded
+        self.close_stream()
+        self._stream = open(file_name, "a", buffering=self.STREAM_BUFFER_SIZE)
+
+    def close_stream(self):
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
 
 
 class PyGameShapesEnum(Enum):
@@ -42,18 +91,68 @@ class PyGameShapesEnum(Enum):
     TRIANGLE = 3
 
 
-class PyGameCoordinatesTransform:
-    @staticmethod
-    def transform_coordinates_flip(coordinates: Tuple[float, float], h: float):
-        (x, y) = coordinates
-        return (x, h - y)
+# pygame draw function of every shape
+_SHAPE_FN = {
+    PyGameShapesEnum.CIRCLE: pygame.draw.circle,
+    PyGameShapesEnum.SQUARE: pygame.draw.rect,
+    PyGameShapesEnum.TRIANGLE: pygame.draw.polygon,
+}
+
+
+class PyGameDirectionsEnum(IntEnum):
+    UP = 0
+    DOWN = 1
+    LEFT = 2
+    RIGHT = 3
+
+
+# Unit step on the (x, y) axes, indexed by PyGameDirectionsEnum
+DIRECTION_DELTAS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
+
+def _trajectory_xy(
+    t: np.ndarray,
+    x0: float,
+    y0: float,
+    vx0: float,
+    vy0: float,
+    half_ax: float,
+    half_ay: float,
+    out_x: np.ndarray,
+    out_y: np.ndarray,
+):
+    # Horner form (0.5 * a * t + v0) * t + p0, computed in place on the output buffers
+    if half_ax == 0:
+        # Uniform horizontal motion, only the vertical axis has the quadratic term
+        np.multiply(t, vx0, out=out_x)
+    else:
+        np.multiply(t, half_ax, out=out_x)
+        out_x += vx0
+        out_x *= t
+
+    out_x += x0
+
+    np.multiply(t, half_ay, out=out_y)
+    out_y += vy0
+    out_y *= t
+    out_y += y0
 
 
 class PyGame2DMotionEquations:
+    __slots__ = (
+        "ay",
+        "ax",
+        "x0",
+        "y0",
+        "vx0",
+        "vy0",
+        "_half_ax",
+        "_half_ay",
+    )
+
     def __init__(
         self,
-        x0: float = 0,
-        y0: float = 0,
+        coords: Tuple[float, float] = (0, 0),
         vx0: float = 0,
         vy0: float = 0,
         gravity: float = 9.81,
@@ -63,43 +162,98 @@ class PyGame2DMotionEquations:
         Implements the 2D motion equations.
 
         Args:
-            x0 (float, optional): Initial horizontal position in meters (default 0).
-            y0 (float, optional): Initial vertical position in meters (default 0).
+            coords (Tuple[float, float], optional): Initial position (x, y) in meters (default (0, 0)).
             vx0 (float, optional): Initial horizontal velocity in meters per second (default 0).
             vy0 (float, optional): Initial vertical velocity in meters per second (default 0).
             gravity (float, optional): Acceleration due to gravity in meters per second squared (default 9.81).
             ax (float, optional): Acceleration
 
         Attributes:
-            ay (float): Acceleration due to gravity in meters per second squared.
+            ay (float): Vertical acceleration in meters per second squared, gravity pulls towards negative y.
             ax (float): Acceleration on the X-axis in meters per second
             x0 (float): Initial horizontal position in meters.
             y0 (float): Initial vertical position in meters.
             vx0 (float): Initial horizontal velocity in meters per second.
             vy0 (float): Initial vertical velocity in meters per second.
         """
-        self.ay = gravity
+        # The y-axis points up, so gravity accelerates towards negative y
+        self.ay = -gravity
         self.ax = ax
-        self.x0 = x0
-        self.y0 = y0
+        (self.x0, self.y0) = coords
         self.vx0 = vx0
         self.vy0 = vy0
 
-    def get_x_position(self, t: float):
-        ax = self.get_x_velocity(t) * t
-        return (0.5 * ax * t**2) + (self.vx0 * t) + self.x0
+        self._half_ax = 0.5 * ax
+        self._half_ay = 0.5 * self.ay
+
+    def precompute_trajectory(self, t_array: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the positions for every time in a single vectorized pass.
+
+        Args:
+            t_array (np.ndarray): Times in seconds at which to evaluate the positions.
+
+        Returns:
+            np.ndarray: A float32 array with the (x, y) positions along the last axis.
+        """
+        points = np.empty(t_array.shape + (2,), dtype=np.float32)
+        _trajectory_xy(
+            t_array,
+            self.x0,
+            self.y0,
+            self.vx0,
+            self.vy0,
+            self._half_ax,
+            self._half_ay,
+            points[..., 0],
+            points[..., 1],
+        )
+        return points
+
+    def get_x_position(self, t: Union[float, np.ndarray]):
+        # Without acceleration on the X-axis the horizontal motion is uniform
+        if self._half_ax == 0:
+            return self.vx0 * t + self.x0
 
-    def get_y_position(self, t: float):
-        return (0.5 * self.ay * t**2) + (self.vy0 * t) + self.y0
+        return (self._half_ax * t**2) + (self.vx0 * t) + self.x0
 
-    def get_x_velocity(self, t: float):
+    def get_y_position(self, t: Union[float, np.ndarray]):
+        return (self._half_ay * t**2) + (self.vy0 * t) + self.y0
+
+    def get_x_velocity(self, t: Union[float, np.ndarray]):
         return self.ax * t + self.vx0
 
-    def get_y_velocity(self, t: float):
+    def get_y_velocity(self, t: Union[float, np.ndarray]):
         return self.ay * t + self.vy0
 
 
 class PyGameObjecMotion(PyGame2DMotionEquations, PyGameFileLogger):
+    __slots__ = (
+        "coords",
+        "metrics",
+        "_pos",
+        "_pos_n",
+        "trajectory_t",
+        "trajectory",
+        "_launch_origin",
+        "_stream",
+    )
+
+    # Launch trajectories are precomputed over this time span [s]
+    LAUNCH_DURATION = 10
+    LAUNCH_SAMPLES = 2401
+
+    # Initial capacity of the positions buffer, it doubles whenever it fills up
+    POSITIONS_CAPACITY = 1024
+
+    # String directions accepted by move, mapped to their table index
+    MOVE_DIRECTIONS = {
+        "up": PyGameDirectionsEnum.UP,
+        "down": PyGameDirectionsEnum.DOWN,
+        "left": PyGameDirectionsEnum.LEFT,
+        "right": PyGameDirectionsEnum.RIGHT,
+    }
+
     def __init__(
         self,
         coords: Tuple,
@@ -122,8 +276,8 @@ class PyGameObjecMotion(PyGame2DMotionEquations, PyGameFileLogger):
             None
 
         Attributes:
-            coords (Tuple): The current coordinates (x, y) of the object.
-            metrics (dict): A dictionary containing metrics such as velocity and position data.
+            coords (pygame.math.Vector2): The current coordinates (x, y) of the object.
+            metrics (dict): A dictionary containing metrics such as velocity and position data (positions as an (n, 2) float32 array).
 
         Example:
             To create a PhysicsObject with initial coordinates (2.0, 3.0),
@@ -133,154 +287,210 @@ class PyGameObjecMotion(PyGame2DMotionEquations, PyGameFileLogger):
             >>> obj = PhysicsObject(initial_coords, vx0=4.0, vy0=5.0, gravity=10.0)
         """
 
-        super().__init__(*coords, vx0, vy0, gravity)
-        self.coords = coords
+        super().__init__(coords, vx0, vy0, gravity, ax)
+        self.coords = pygame.math.Vector2(self.x0, self.y0)
+        # Positions are stored unboxed in a growing buffer, metrics exposes a view
+        self._pos = np.empty((self.POSITIONS_CAPACITY, 2), dtype=np.float32)
+        self._pos_n = 0
         self.metrics = {
             "velocity": [],
-            "position": [],
+            "position": self._pos[:0],
         }
 
-    def _forward(self, h: float, yi: float = 1):
-        (x, y) = self.coords
-
-        if y - yi <= 0:
-            y = h
-        else:
-            y -= yi
+        # Precomputed launch displacements, evaluated on the first launch
+        self.trajectory_t = np.linspace(0, self.LAUNCH_DURATION, self.LAUNCH_SAMPLES)
+        self.trajectory = None
+        self._launch_origin = None
 
-        self.coords = (x, y)
+        self._stream = None
 
-        self.metrics["position"].append(self.coords)
+    def _step(self, dx: float, dy: float, w: float, h: float, steps: int = 1):
+        coords = self.coords
+        (x, y) = (coords.x, coords.y)
+        positions = []
 
-    def _backwards(self, h: float, yi: float = 1):
-        (x, y) = self.coords
+        for _ in range(steps):
+            x += dx
+            y += dy
 
-        if y + yi >= h:
-            y = 0
-        else:
-            y += yi
+            # The move stops at the first step that leaves the screen along a moving axis
+            if (dx and not 0 < x < w) or (dy and not 0 < y < h):
+                break
 
-        self.coords = (x, y)
+            positions.append((x, y))
 
-        self.metrics["position"].append(self.coords)
+        if not positions:
+            return
 
-    def _left(self, w: float, xi: float = 1):
-        (x, y) = self.coords
+        coords.update(*positions[-1])
 
-        if x - xi <= 0:
-            x = w
-        else:
-            x -= xi
+        self._record_positions(positions)
 
-        self.coords = (x, y)
+    def _record_positions(self, positions: List[Tuple[float, float]]):
+        start = self._pos_n
+        end = start + len(positions)
 
-        self.metrics["position"].append(self.coords)
+        if end > len(self._pos):
+            capacity = len(self._pos)
 
-    def _right(self, w: float, xi: float = 1):
-        (x, y) = self.coords
+            while capacity < end:
+                capacity *= 2
 
-        if x + xi >= w:
-            x = 0
-        else:
-            x += xi
+            grown = np.empty((capacity, 2), dtype=np.float32)
+            grown[:start] = self._pos[:start]
+            self._pos = grown
 
-        self.coords = (x, y)
+        self._pos[start:end] = positions
+        self._pos_n = end
+        self.metrics["position"] = self._pos[:end]
 
-        self.metrics["position"].append(self.coords)
+        if self._stream is not None:
+            # Same row format as PyGameFileLogger.log
+            self._stream.write("".join([f"{x:.6g},{y:.6g}\n" for x, y in positions]))
 
-    def _check_screen_collition(
-        self, screen_width: int, screen_height: int, xi: int, yi: int, direction: str
-    ):
-        (x, y) = self.coords
+    def _forward(self, h: float, yi: float = 1):
+        self._step(0, -yi, 0, h)
 
-        if direction == "right" and x + xi >= screen_width:
-            # x = 0
-            return False
-        elif direction == "left" and x - xi <= 0:
-            # x = screen_width
-            return False
-        elif direction == "up" and y - yi <= 0:
-            # y = 0
-            return False
-        elif direction == "down" and y + yi >= screen_height:
-            # y = screen_height
-            return False
+    def _backwards(self, h: float, yi: float = 1):
+        self._step(0, yi, 0, h)
 
-        return True
+    # Jump steps indexed by PyGameDirectionsEnum.UP and PyGameDirectionsEnum.DOWN
+    _JUMPS = (_forward, _backwards)
 
     def move(
         self,
-        direction: str,
+        direction: Union[str, PyGameDirectionsEnum],
         h: float,
         w: float,
         yi: float = 1,
         xi: float = 1,
         steps: int = 1,
     ):
-        if not self._check_screen_collition(
-            screen_height=h,
-            screen_width=w,
-            xi=xi,
-            yi=yi,
-            direction=direction,
-        ):
-            return
+        # Resolve the direction once at the edge, the rest is table driven
+        if isinstance(direction, str):
+            direction = self.MOVE_DIRECTIONS.get(direction)
 
-        for _ in range(steps):
-            if direction == "up":
-                self._forward(h, yi)
-            elif direction == "down":
-                self._backwards(h, yi)
-            elif direction == "left":
-                self._left(w, xi)
-            elif direction == "right":
-                self._right(w, xi)
-            else:
-                raise ValueError("Direction is not valid")
-
-    def jump(self, yi: int = 1, direction: Literal["up", "down"] = "up"):
-        if direction == "up" and yi >= 0:
-            self._forward(yi)
-        elif direction == "down" and yi <= 0:
-            self._backwards(yi)
-        else:
+        try:
+            direction = PyGameDirectionsEnum(direction)
+        except ValueError:
+            raise ValueError("Direction is not valid") from None
+
+        (dx, dy) = DIRECTION_DELTAS[direction]
+        self._step(dx * xi, dy * yi, w, h, steps)
+
+    def jump(
+        self,
+        yi: float = 1,
+        direction: Union[str, PyGameDirectionsEnum] = PyGameDirectionsEnum.UP,
+        *,
+        h: float,
+    ):
+        # String directions are only resolved here, the jump itself is a table call
+        if isinstance(direction, str):
+            direction = self.MOVE_DIRECTIONS.get(direction)
+
+        if direction not in (PyGameDirectionsEnum.UP, PyGameDirectionsEnum.DOWN):
             raise ValueError("Direction is not valid")
 
-    def check_object_collision(self, objects):
-        pass
+        self._JUMPS[direction](self, h, abs(yi))
 
-    def launch(self, t: float):
-        x = self.get_x_position(t / 1000)
-        y = self.get_y_position(t / 1000)
-        print(f"Launching position => ({x}, {y})")
-        self.coords = (x, y)
+    def check_object_collision(self, objects: np.ndarray, radius: float) -> np.ndarray:
+        """
+        Finds the objects colliding with this one in a single vectorized pass.
 
-    def get_velocity_module(self, t: float):
+        Args:
+            objects (np.ndarray): An (N, 2+) array with the (x, y) position of every object in its first two columns.
+            radius (float): Distance between centers under which two objects collide.
+
+        Returns:
+            np.ndarray: The indexes of the colliding objects.
+        """
+        dx = objects[:, 0] - self.coords.x
+        dy = objects[:, 1] - self.coords.y
+
+        # Compare squared distances to skip the square root
+        return np.flatnonzero(dx * dx + dy * dy < radius * radius)
+
+    def start_launch(self):
+        if self.trajectory is None:
+            # The path is the same for every launch, only its origin changes
+            self.trajectory = self.precompute_trajectory(self.trajectory_t)
+            self.trajectory -= (self.x0, self.y0)
+
+        coords = self.coords
+        self._launch_origin = (coords.x, coords.y)
+
+    def launch(self, t: float, w: float, h: float) -> bool:
+        """
+        Moves the object along the launch path, starting from where the launch began.
+
+        Args:
+            t (float): Time since the launch started in seconds.
+            w (float): Width of the screen.
+            h (float): Height of the screen.
+
+        Returns:
+            bool: False once the launch is over, when the path leaves the screen or its duration runs out.
+        """
+        if self._launch_origin is None:
+            self.start_launch()
+
+        # Closest precomputed sample to the given time
+        t_step = self.LAUNCH_DURATION / (self.LAUNCH_SAMPLES - 1)
+        i = round(t / t_step)
+
+        if i >= self.LAUNCH_SAMPLES:
+            self._launch_origin = None
+            return False
+
+        (dx, dy) = self.trajectory[i].tolist()
+        (x0, y0) = self._launch_origin
+        (x, y) = (x0 + dx, y0 + dy)
+
+        # The object stays at its last position on the screen
+        if not (0 < x < w and 0 < y < h):
+            self._launch_origin = None
+            return False
+
+        self.coords.update(x, y)
+
+        self._record_positions([(x, y)])
+
+        return True
+
+    def get_velocity_module_sq(self, t: float):
+        # Compare against squared thresholds to avoid the square root
         if t <= 0:
-            return math.sqrt(self.vx0**2 + self.vy0)
+            return self.vx0 * self.vx0 + self.vy0 * self.vy0
 
         vx = self.get_x_velocity(t)
         vy = self.get_y_velocity(t)
 
-        return math.sqrt(vx**2 + vy**2)
+        return vx * vx + vy * vy
+
+    def get_velocity_module(self, t: float):
+        return math.sqrt(self.get_velocity_module_sq(t))
 
     def get_velocity_angle(self):
-        return math.atan(self.coords[0] / self.coords[1])
+        return math.atan(self.coords.x / self.coords.y)
 
     def get_y_max(self, t: float):
         # The max height is reached when the velocity of the object equals 0
         pass
 
 
-class PyGameObject(PyGameObjecMotion, PyGameCoordinatesTransform):
-    DEFAULT_COLOR = (255, 0, 0)
+class PyGameObject(PyGameObjecMotion):
+    __slots__ = (
+        "shape",
+        "surface",
+        "options",
+        "_screen_h",
+        "_sprite",
+        "_radius",
+        "_draw_fn",
+    )
 
-    # ! Move this to a separate class later
-    get_pygame_shape = {
-        PyGameShapesEnum.CIRCLE: pygame.draw.circle,
-        PyGameShapesEnum.SQUARE: pygame.draw.rect,
-        PyGameShapesEnum.TRIANGLE: pygame.draw.polygon,
-    }
+    DEFAULT_COLOR = (255, 0, 0)
 
     def __init__(
         self,
@@ -320,53 +530,204 @@ class PyGameObject(PyGameObjecMotion, PyGameCoordinatesTransform):
             >>> obj = PhysicsObject(surface, initial_coords, shape)
         """
         super().__init__(coords, vx0, vy0, gravity)
-        self.shape = self.get_pygame_shape[shape]
+        self.shape = _SHAPE_FN[shape]
         self.surface = surface
-        self.options = kwargs if len(kwargs.items()) else {}
+        self.options = kwargs
+        self._screen_h = surface.get_height()
+
+        # Circles are rasterized once and then blitted on every draw
+        self._sprite = None
+        self._radius = None
+
+        if shape is PyGameShapesEnum.CIRCLE:
+            self._radius = self.options.pop("radius")
+            self._sprite = self._render_circle_sprite()
+
+        # Other shapes are drawn through a call with every argument but the position bound
+        self._draw_fn = partial(
+            self.shape, self.surface, self.DEFAULT_COLOR, **self.options
+        )
+
+    def _render_circle_sprite(self):
+        radius = self._radius
+        sprite = pygame.Surface((2 * radius, 2 * radius), pygame.SRCALPHA)
+        pygame.draw.circle(
+            sprite, self.DEFAULT_COLOR, (radius, radius), radius, **self.options
+        )
+
+        # Match the display pixel format so blits take the fast path
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+
+        return sprite
 
     def draw(self):
         # Flip the coordinates to match the pygame's coordinate system
-        # ! Change HEIGHT to a global variable as well as the WIDTH
-        flipped_coords = self.transform_coordinates_flip(self.coords, 600)
-        return self.shape(
-            self.surface, self.DEFAULT_COLOR, flipped_coords, **self.options
-        )
+        coords = self.coords
+        (x, y) = (coords.x, self._screen_h - coords.y)
+
+        if self._sprite is not None:
+            radius = self._radius
+            return self.surface.blit(self._sprite, (x - radius, y - radius))
+
+        return self._draw_fn((x, y))
 
     def track_object(self, x_target: float, y_target: float):
         # Draw a line that goes from (x_object, y_object) to (x_target, y_target)
-        x, y = self.transform_coordinates_flip(self.coords, h=600)
+        coords = self.coords
         return pygame.draw.line(
             self.surface,
             (0, 0, 255),
-            (x, y),
+            (coords.x, self._screen_h - coords.y),
             (x_target, y_target),
         )
 
 
 class PygameApp:
     DRACULA_THEME = (40, 42, 54)
+    MAX_UPDATE_AREA_RATIO = 0.25
+
+    # The physics advance in fixed steps [s], independently of the frame rate
+    PHYSICS_DT = 1 / 240
+    # Longest frame time fed to the physics, so a stall doesn't fast-forward them
+    MAX_FRAME_DT = 0.25
+
+    # Projectiles are stored as rows of [x, y, vx, vy] in world coordinates
+    PROJECTILES_CAPACITY = 64
+    PROJECTILE_RADIUS = 4
+    PROJECTILE_COLOR = (241, 250, 140)
+    # Launch speed [px/s] and gravity [px/s^2] of the projectiles
+    PROJECTILE_SPEED = 400
+    PROJECTILE_GRAVITY = 490
 
     def __init__(
-        self, width, height, caption, bg_color=DRACULA_THEME, texts={}, **kwargs
+        self,
+        width,
+        height,
+        caption,
+        bg_color=DRACULA_THEME,
+        texts={},
+        debug=False,
+        **kwargs,
     ):
         self.width = width
         self.height = height
         self.caption = caption
         self.bg_color = bg_color
         self.screen = pygame.display.set_mode((width, height))
-        self.options = kwargs if len(kwargs.items()) else {}
+        self.options = kwargs
         self.texts = texts
+        self.debug = debug
 
         pygame.display.set_caption(caption)
         self.clock = pygame.time.Clock()
 
-        self.current_time = 0
-        self.previous_time = 0
+        self._projectiles = np.empty((self.PROJECTILES_CAPACITY, 4), dtype=np.float32)
+        self._projectiles_n = 0
+
+        self.launch_projectile = False
+        self.track_projectile = False
+        # Time since the projectile was launched [s]
+        self.launch_time = 0
+        self.text_entries = ["", "", "9.81 [m/s^2]", ""]
+
+        # Regions drawn in the previous frame, they are the only ones to clear. The
+        # tracking line and the player are keyed by object, projectiles have no
+        # stable identity as the buffer is compacted when one is removed
+        self._last_dirty = {}
+        self._last_projectile_rects = []
+
+        # Key down handlers, looked up by key instead of walking an if-elif chain.
+        # The ones that act on the player, including the launch, are added by run
+        self._keydown_handlers = {
+            pygame.K_t: self.toggle_track_projectile,
+        }
 
     @staticmethod
     def to_seconds(milliseconds: float):
         return milliseconds / 1000
 
+    def toggle_launch_projectile(self):
+        self.launch_projectile = not self.launch_projectile
+        # Every launch starts over from the beginning of the path
+        self.launch_time = 0
+
+    def toggle_track_projectile(self):
+        self.track_projectile = not self.track_projectile
+
+    def shoot_projectile(
+        self,
+        origin: Tuple[float, float],
+        target: Tuple[float, float],
+        offset: float = 0,
+    ):
+        (x, y) = origin
+        dx = target[0] - x
+        dy = target[1] - y
+        distance = math.hypot(dx, dy)
+
+        if distance == 0:
+            return
+
+        n = self._projectiles_n
+
+        if n == len(self._projectiles):
+            grown = np.empty((2 * n, 4), dtype=np.float32)
+            grown[:n] = self._projectiles
+            self._projectiles = grown
+
+        # Start the projectile offset from the origin, in the shooting direction
+        ux = dx / distance
+        uy = dy / distance
+        self._projectiles[n] = (
+            x + ux * offset,
+            y + uy * offset,
+            ux * self.PROJECTILE_SPEED,
+            uy * self.PROJECTILE_SPEED,
+        )
+        self._projectiles_n = n + 1
+
+    def update_projectiles(
+        self, dt: float, player: PyGameObjecMotion, player_radius: float
+    ):
+        n = self._projectiles_n
+
+        if n == 0:
+            return
+
+        # The acceleration is constant, so all the projectiles are moved exactly at once
+        states = self._projectiles[:n]
+        g = self.PROJECTILE_GRAVITY
+        states[:, :2] += states[:, 2:] * dt
+        states[:, 1] -= 0.5 * g * dt * dt
+        states[:, 3] -= g * dt
+
+        # Drop the projectiles that hit the player or leave the screen (they may
+        # still fall back from above)
+        alive = (states[:, 0] >= 0) & (states[:, 0] <= self.width) & (states[:, 1] >= 0)
+        alive[
+            player.check_object_collision(
+                states, player_radius + self.PROJECTILE_RADIUS
+            )
+        ] = False
+        alive_n = int(np.count_nonzero(alive))
+
+        if alive_n != n:
+            self._projectiles[:alive_n] = states[alive]
+            self._projectiles_n = alive_n
+
+    def draw_projectiles(self):
+        screen = self.screen
+        color = self.PROJECTILE_COLOR
+        radius = self.PROJECTILE_RADIUS
+        draw_circle = pygame.draw.circle
+
+        # Flip the coordinates of all the projectiles in a single vectorized pass
+        points = self._projectiles[: self._projectiles_n, :2].astype(np.float64)
+        np.subtract(self.height, points[:, 1], out=points[:, 1])
+
+        return [draw_circle(screen, color, point, radius) for point in points.tolist()]
+
     def get_cursor_position(self):
         x, y = pygame.mouse.get_pos()
         return x, y
@@ -385,9 +746,35 @@ class PygameApp:
             radius=player_radius,
         )
 
+        #  Save the position metrics to a csv file while the player moves
+        player.open_stream("position.csv")
+
         target_coordinates = (0, 0)
-        launch_projectile = False
-        track_projectile = False
+
+        def toggle_launch():
+            self.toggle_launch_projectile()
+
+            # The player is launched from where it currently is
+            if self.launch_projectile:
+                player.start_launch()
+
+        self._keydown_handlers.update(
+            {
+                pygame.K_UP: lambda: player.move(
+                    "up", self.height, self.width, yi=5, steps=3
+                ),
+                pygame.K_DOWN: lambda: player.move(
+                    "down", self.height, self.width, yi=5, steps=3
+                ),
+                pygame.K_LEFT: lambda: player.move(
+                    "left", self.height, self.width, yi=0, xi=5, steps=3
+                ),
+                pygame.K_RIGHT: lambda: player.move(
+                    "right", self.height, self.width, yi=0, xi=5, steps=3
+                ),
+                pygame.K_SPACE: toggle_launch,
+            }
+        )
 
         # player tracking line coordinates
         x_target = 0
@@ -397,102 +784,182 @@ class PygameApp:
         # Delta time (time is framerate independent)
         # Time difference between current frame and the previous one
         dt = 0
-        # self.current_time = pygame.time.get_ticks()
-        self.current_time = time()
-
-        self.text_list = {
-            "coordinates": "",
-            "velocity": "",
-            "acceleration (y-axis)": "9.81 [m/s^2]",
-            "acceleration (x-axis)": "",
-        }
+
+        # Simulation time not consumed by a physics step yet
+        physics_accumulator = 0
+        physics_dt = self.PHYSICS_DT
+        # Text labels are created once, they only re-rasterize when their text changes
+        text_color = (255, 255, 255)
+        coordinates_label = PyGameText("", (0, 0), text_color)
+        player_label = PyGameText("", (0, 27), text_color)
+        time_label = PyGameText("", (0, 54), text_color)
+        acceleration_label = PyGameText(
+            "Acceleration (y-axis): " + self.text_entries[TEXT_AY],
+            (0, 81),
+            text_color,
+        )
+        text_labels = [coordinates_label, player_label, time_label, acceleration_label]
+
+        # Fall back to a full display flip when the updated area gets too large
+        max_update_area = self.width * self.height * self.MAX_UPDATE_AREA_RATIO
+
+        # Paint the whole background once, afterwards only dirty regions are cleared
+        self.screen.fill(self.bg_color)
+        pygame.display.flip()
+
+        # Bind the functions used on every frame to locals to skip attribute lookups
+        event_get = pygame.event.get
+        screen_fill = self.screen.fill
+        flip = pygame.display.flip
+        display_update = pygame.display.update
+        tick = self.clock.tick
+        to_seconds = self.to_seconds
+        get_ticks = pygame.time.get_ticks
+        bg_color = self.bg_color
+        text_entries = self.text_entries
+        get_keydown_handler = self._keydown_handlers.get
+        player_draw = player.draw
+        QUIT = pygame.QUIT
+        MOUSEMOTION = pygame.MOUSEMOTION
+        MOUSEBUTTONDOWN = pygame.MOUSEBUTTONDOWN
+        KEYDOWN = pygame.KEYDOWN
 
         while running:
             # Get the cursor position
             x, y = self.get_cursor_position()
             # print(f"Cursor: ({x}, {y}) \n")
-            self.text_list["coordinates"] = f"({x}, {y})"
+            text_entries[TEXT_COORDS] = f"({x}, {y})"
 
-            formatted_current_time = "{:.20f}".format(self.current_time)
-            formatted_previous_time = "{:20f}".format(self.previous_time)
-            formatted_delta_time = "{:20f}".format(dt)
+            # Debug strings are only formatted when running in debug mode
+            if self.debug:
+                formatted_delta_time = "{:20f}".format(dt)
+                print(f"Delta time = {formatted_delta_time} [s]")
 
-            # print(f"Current time = {formatted_current_time} [ms]")
-            # print(f"Previous time = {formatted_previous_time} [ms]")
-            # print(f"Formatted time = {formatted_delta_time} [ms]")
+            for event in event_get():
+                event_type = event.type
 
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+                if event_type == QUIT:
                     running = False
 
-                elif event.type == pygame.MOUSEMOTION:
+                elif event_type == MOUSEMOTION:
                     x_target, y_target = self.get_cursor_position()
 
-                elif event.type == pygame.MOUSEBUTTONDOWN:
+                elif event_type == MOUSEBUTTONDOWN:
                     if event.button == 1:
                         target_coordinates = self.get_cursor_position()
                         print(f"Shooting at {target_coordinates}")
 
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_UP:
-                        player.move("up", self.height, self.width, yi=5, steps=3)
-                    elif event.key == pygame.K_DOWN:
-                        player.move("down", self.height, self.width, yi=5, steps=3)
-                    elif event.key == pygame.K_LEFT:
-                        player.move(
-                            "left", self.height, self.width, yi=0, xi=5, steps=3
-                        )
-                    elif event.key == pygame.K_RIGHT:
-                        player.move(
-                            "right", self.height, self.width, yi=0, xi=5, steps=3
+                        (x_shot, y_shot) = target_coordinates
+                        self.shoot_projectile(
+                            (player.coords.x, player.coords.y),
+                            (x_shot, self.height - y_shot),
+                            offset=player_radius + self.PROJECTILE_RADIUS + 1,
                         )
-                    elif event.key == pygame.K_SPACE:
-                        launch_projectile = not launch_projectile
-                    elif event.key == pygame.K_t:
-                        track_projectile = not track_projectile
 
-            # Fill the screen with the background color (clear it)
-            self.screen.fill(self.bg_color)
+                elif event_type == KEYDOWN:
+                    handler = get_keydown_handler(event.key)
 
-            # -- Draw all the objects
+                    if handler is not None:
+                        handler()
 
-            # Draw the player in the current pygame screen object
-            if launch_projectile:
-                # ? Which time to use ?
-                # player.launch(t=)
-                pass
+            # Advance the physics in whole fixed steps, the render only reads the
+            # latest coordinates
+            physics_accumulator += min(dt, self.MAX_FRAME_DT)
+            physics_steps = int(physics_accumulator / physics_dt)
+            physics_accumulator -= physics_steps * physics_dt
 
-            if track_projectile:
-                # x_target, y_target = self.get_cursor_position()
-                # print(f"({x_target}, {y_target})")
-                player.track_object(x_target, y_target)
+            # Every step runs the bounds and collision checks, so fast projectiles
+            # can't pass through the player between two frames
+            for _ in range(physics_steps):
+                if self.launch_projectile:
+                    self.launch_time += physics_dt
+
+                    if not player.launch(self.launch_time, self.width, self.height):
+                        self.launch_projectile = False
 
-            player.draw()
+                self.update_projectiles(physics_dt, player, player_radius)
 
             # Render text
-            coordinates_text = "Cursor: " + self.text_list["coordinates"]
-            player_text = f"Player: ({player.coords[0]}, {player.coords[1]})"
-            time_text = f"Time: {pygame.time.get_ticks() / 1000} [s]"
+            coordinates_label.text = "Cursor: " + text_entries[TEXT_COORDS]
+            player_label.text = f"Player: ({player.coords.x}, {player.coords.y})"
+            time_label.text = f"Time: {get_ticks() / 1000} [s]"
+
+            # Labels whose text changed are blitted again below, their previous text
+            # may be wider than the new one
+            changed_labels = [
+                text_label
+                for text_label in text_labels
+                if text_label.rect is not None and text_label.is_changed()
+            ]
+
+            # Clear the regions drawn in the previous frame, before the objects are
+            # drawn so the ones under a shrinking label are not erased
+            last_dirty = self._last_dirty
+            cleared_rects = [*last_dirty.values(), *self._last_projectile_rects]
+            cleared_rects += [text_label.rect for text_label in changed_labels]
+
+            for dirty_rect in cleared_rects:
+                screen_fill(bg_color, dirty_rect)
 
-            PyGameText(coordinates_text, (0, 0), (255, 255, 255)).render(
-                screen=self.screen
-            )
-            PyGameText(player_text, (0, 27), (255, 255, 255)).render(screen=self.screen)
-            PyGameText(time_text, (0, 54), (255, 255, 255)).render(screen=self.screen)
+            # -- Draw all the objects
+            drawn_rects = {}
 
-            # Update the display
-            pygame.display.flip()
+            if self.track_projectile:
+                # x_target, y_target = self.get_cursor_position()
+                # print(f"({x_target}, {y_target})")
+                drawn_rects["line"] = player.track_object(x_target, y_target)
+
+            drawn_rects["player"] = player_draw()
+            projectile_rects = self.draw_projectiles()
+
+            # Update only the regions that changed, merging the previous and the
+            # current region of the same object into a single rect. The regions of
+            # the projectiles are small, so they are pushed separately
+            update_rects = [
+                rect.union(last_dirty[key]) if key in last_dirty else rect
+                for key, rect in drawn_rects.items()
+            ]
+            update_rects += [
+                rect for key, rect in last_dirty.items() if key not in drawn_rects
+            ]
+            update_rects += self._last_projectile_rects
+            update_rects += projectile_rects
+            all_drawn_rects = [*drawn_rects.values(), *projectile_rects]
+
+            # Labels have an opaque background, so they are not cleared every frame.
+            # They are blitted last, only when their text changes or when a cleared
+            # or drawn region overlaps them, keeping the text on top of the objects
+            for text_label in text_labels:
+                label_rect = text_label.rect
+
+                if label_rect is None:
+                    update_rects.append(text_label.render(screen=self.screen))
+                elif text_label in changed_labels:
+                    new_rect = text_label.render(screen=self.screen)
+                    update_rects.append(label_rect.union(new_rect))
+                elif (
+                    label_rect.collidelist(cleared_rects) != -1
+                    or label_rect.collidelist(all_drawn_rects) != -1
+                ):
+                    update_rects.append(text_label.render(screen=self.screen))
+
+            if sum(rect.w * rect.h for rect in update_rects) > max_update_area:
+                flip()
+            else:
+                display_update(update_rects)
 
-            # Update the screen 60 times per second
-            self.clock.tick(60)
+            self._last_dirty = {
+                key: rect.inflate(2, 2) for key, rect in drawn_rects.items()
+            }
+            self._last_projectile_rects = [
+                rect.inflate(2, 2) for rect in projectile_rects
+            ]
 
-            # ! -- Time management
-            dt = (self.current_time - self.previous_time) / 1000
-            self.previous_time = self.current_time
-            self.current_time = time()
+            # Update the screen 60 times per second
+            # ! -- Time management: tick returns the milliseconds since the last frame
+            dt = to_seconds(tick(60))
 
-        #  Save the position metrics to a csv file
-        player.log(player.metrics["position"], "position.csv")
+        player.close_stream()
 
         pygame.quit()
 